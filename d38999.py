@@ -4,15 +4,124 @@ Constructs part numbers and returns specifications per MIL-DTL-38999
 """
 import math
 import os
+import sys
+import string
 import itertools
 import json
+import csv
+import gzip
+import io
+import functools
+import logging
+from collections import Counter, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_LOG = logging.getLogger(__name__)
 
 # Configuration constants
 REVISION = 1
 RELEASE_STATUS = None  # None, 'Draft', 'Review', 'Released', 'Obsolete'
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Threads for batch file I/O
+
+# Placeholder for missing values, shared by the class tables and attribute documents
+_NA = sys.intern('N/A')
+
+# Report separators
+SEP_EQ = "=" * 70
+SEP_DASH = "-" * 70
+_PROP_HEADER = f"\n{SEP_EQ}\nD38999 CONNECTOR SPECIFICATIONS\n{SEP_EQ}"
+
+# Report row for one contact position record
+_POSITION_ROW = "  {label}: Angle={angle}°, Radius={radius}mm".format_map
+
+# Contact position labels; MIL-DTL-38999 inserts skip I, O and Q
+_MIL_LABELS = tuple(c for c in string.ascii_uppercase if c not in 'IOQ')
+
+# Static fragments of the connector face SVG
+_SVG_DEFS = '''  <defs>
+    <style>
+      .shell { fill: #cccccc; stroke: #333333; stroke-width: 2; }
+      .contact { fill: #ffd700; stroke: #333333; stroke-width: 1; }
+      .label { font-family: Arial; font-size: 10px; fill: #000000; text-anchor: middle; }
+      .title { font-family: Arial; font-size: 14px; font-weight: bold; fill: #000000; }
+      .keyway { fill: #666666; }
+    </style>
+  </defs>'''
+_SVG_LEGEND = '''
+  <!-- Legend -->
+  <text x="10" y="380" class="label" text-anchor="start">● Pin Contact</text>
+  <text x="10" y="395" class="label" text-anchor="start">▮ Master Keyway</text>
+</svg>'''
+
+# Placeholder drawing, pre-encoded around the directory name and revision
+_PLACEHOLDER_SVG_HEAD = b'''<?xml version="1.0" encoding="UTF-8"?>
+<svg width="400" height="400" xmlns="http://www.w3.org/2000/svg">
+  <defs>
+    <style>
+      .placeholder { fill: #f0f0f0; stroke: #999999; stroke-width: 2; stroke-dasharray: 5,5; }
+      .text { font-family: Arial; font-size: 14px; fill: #666666; text-anchor: middle; }
+    </style>
+  </defs>
+  
+  <rect x="10" y="10" width="380" height="380" class="placeholder"/>
+  <text x="200" y="190" class="text">'''
+_PLACEHOLDER_SVG_MID = b'''</text>
+  <text x="200" y="210" class="text">Revision '''
+_PLACEHOLDER_SVG_TAIL = b'''</text>
+  <text x="200" y="230" class="text">Drawing Placeholder</text>
+</svg>'''
+
+
+def _json_default(obj):
+    """Serialize the read-only table records as plain JSON objects"""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(obj, indent=True):
+    """Serialize to JSON bytes, using orjson when it is installed; compact unless indent"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False,
+                      default=_json_default).encode('utf-8')
+
+
+def _thaw(value):
+    """Mutable copy of a frozen table value: mappings become dicts, tuples lists"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Lookup table records
+ShellSize = namedtuple('ShellSize', ['size', 'thread_size'])
+ContactType = namedtuple('ContactType', ['type', 'cycles'], defaults=[None])
+
+
+@functools.lru_cache(maxsize=None)
+def _title_label(key):
+    """Display label for a table key, e.g. 'shell_dia' -> 'Shell Dia'"""
+    return sys.intern(key.replace('_', ' ').title())
+
 
 class D38999PartNumber:
+    # Per-instance fields; lookup tables below stay class attributes
+    __slots__ = ('series_code', 'class_code', 'shell_code', 'insert_arrangement',
+                 'contact_type', 'polarization', 'series', 'series_desc', '_part_number',
+                 '_props')
+    
     # Series definitions
     SERIES_III = {
         '26': 'Plug with accessory threads',
@@ -73,27 +182,30 @@ class D38999PartNumber:
               'conductive': True, 'space_grade': True}
     }
     
+    # All classes, environmental and hermetic
+    ALL_CLASSES = {**ENV_CLASSES, **HERMETIC_CLASSES}
+    
     # Shell sizes
     SHELL_SIZES = {
-        'A': {'size': 9, 'thread_size': 'M12'},
-        'B': {'size': 11, 'thread_size': 'M15'},
-        'C': {'size': 13, 'thread_size': 'M18'},
-        'D': {'size': 15, 'thread_size': 'M22'},
-        'E': {'size': 17, 'thread_size': 'M25'},
-        'F': {'size': 19, 'thread_size': 'M28'},
-        'G': {'size': 21, 'thread_size': 'M31'},
-        'H': {'size': 23, 'thread_size': 'M34'},
-        'J': {'size': 25, 'thread_size': 'M37'}
+        'A': ShellSize(9, 'M12'),
+        'B': ShellSize(11, 'M15'),
+        'C': ShellSize(13, 'M18'),
+        'D': ShellSize(15, 'M22'),
+        'E': ShellSize(17, 'M25'),
+        'F': ShellSize(19, 'M28'),
+        'G': ShellSize(21, 'M31'),
+        'H': ShellSize(23, 'M34'),
+        'J': ShellSize(25, 'M37')
     }
     
     # Contact types
     CONTACT_TYPES = {
-        'P': {'type': 'Pin', 'cycles': 500},
-        'S': {'type': 'Socket', 'cycles': 500},
-        'H': {'type': 'Pin', 'cycles': 1500},
-        'J': {'type': 'Socket', 'cycles': 1500},
-        'A': {'type': 'Pin insert, less standard contacts'},
-        'B': {'type': 'Socket insert, less standard contacts'}
+        'P': ContactType('Pin', 500),
+        'S': ContactType('Socket', 500),
+        'H': ContactType('Pin', 1500),
+        'J': ContactType('Socket', 1500),
+        'A': ContactType('Pin insert, less standard contacts'),
+        'B': ContactType('Socket insert, less standard contacts')
     }
     
     # Contact sizes and specifications
@@ -106,6 +218,14 @@ class D38999PartNumber:
         '23': {'type': 'High-Density', 'wire_awg': '#22-#26', 'env_current': 5, 'hermetic_current': 5}
     }
     
+    # Contact diameters in mm for drawings
+    CONTACT_DIAMETERS = {
+        '22D': 1.3,
+        '20': 1.5,
+        '16': 2.0,
+        '12': 2.8
+    }
+    
     # Polarization options
     POLARIZATIONS = {
         'N': 'Normal (Master key)',
@@ -132,8 +252,8 @@ class D38999PartNumber:
                              {'label': 'F', 'angle': 300, 'radius': 2.5}]},
         'B35': {'contacts': 13, 'size': '22D', 'service_rating': 'M',
                 'positions': [{'label': 'A', 'angle': 0, 'radius': 0}] +
-                            [{'label': chr(66+i), 'angle': i*60, 'radius': 2.5} for i in range(6)] +
-                            [{'label': chr(72+i), 'angle': 30+i*60, 'radius': 4.5} for i in range(6)]},
+                            [{'label': _MIL_LABELS[1+i], 'angle': i*60, 'radius': 2.5} for i in range(6)] +
+                            [{'label': _MIL_LABELS[7+i], 'angle': 30+i*60, 'radius': 4.5} for i in range(6)]},
         'C35': {'contacts': 22, 'size': '22D', 'service_rating': 'M'},
         'D35': {'contacts': 37, 'size': '22D', 'service_rating': 'M'},
         'E35': {'contacts': 55, 'size': '22D', 'service_rating': 'M'},
@@ -210,6 +330,10 @@ class D38999PartNumber:
         'J': {'shell_dia': 1.672, 'thread': 'M37', 'panel_cutout_wall': 1.484, 'panel_cutout_jam': 1.760}
     }
     
+    # Per-series coupling mechanism and dimension table
+    COUPLING_TYPES = {'III': 'Triple-start thread', 'IV': '90° breech-lock'}
+    SERIES_DIMENSIONS = {'III': SERIES_III_DIMENSIONS, 'IV': SERIES_IV_DIMENSIONS}
+    
     # Crimp tooling requirements
     CRIMP_TOOLS = {
         '22D': {
@@ -269,13 +393,29 @@ class D38999PartNumber:
             self.series_desc = self.SERIES_IV[series_code]
         else:
             raise ValueError(f"Invalid series code: {series_code}")
+        
+        self._part_number = f"D38999/{series_code}{self.class_code}{self.shell_code}{self.insert_arrangement}{self.contact_type}{self.polarization}"
+        self._props = None
     
     def build_part_number(self):
         """Construct the full D38999 part number"""
-        return f"D38999/{self.series_code}{self.class_code}{self.shell_code}{self.insert_arrangement}{self.contact_type}{self.polarization}"
+        return self._part_number
+    
+    @property
+    def properties(self):
+        """Read-only mapping of all properties, computed once per configuration"""
+        if self._props is None:
+            self._props = _compute_properties(type(self), self.series_code, self.class_code,
+                                              self.shell_code, self.insert_arrangement,
+                                              self.contact_type, self.polarization)
+        return self._props
     
     def get_properties(self):
-        """Return all properties of the connector"""
+        """Return all properties of the connector as an independent plain dict"""
+        return {key: _thaw(value) for key, value in self.properties.items()}
+    
+    def _build_properties(self):
+        """Assemble the property dict from the lookup tables (uncached)"""
         props = {
             'part_number': self.build_part_number(),
             'series': self.series,
@@ -284,151 +424,190 @@ class D38999PartNumber:
         }
         
         # Add class/finish information
-        all_classes = {**self.ENV_CLASSES, **self.HERMETIC_CLASSES}
-        if self.class_code in all_classes:
-            class_info = all_classes[self.class_code]
+        class_info = self.ALL_CLASSES.get(self.class_code)
+        if class_info is not None:
             props['class'] = self.class_code
             props['finish'] = class_info['name']
             props['material'] = class_info['material']
-            props['temperature_range'] = class_info.get('temp_range', 'N/A')
-            props['salt_spray'] = class_info.get('salt_spray', 'N/A')
-            props['conductive'] = class_info.get('conductive', False)
-            props['space_grade'] = class_info.get('space_grade', False)
+            props['temperature_range'] = class_info['temp_range']
+            props['salt_spray'] = class_info['salt_spray']
+            props['conductive'] = class_info['conductive']
+            props['space_grade'] = class_info['space_grade']
         
         # Add shell size information
-        if self.shell_code in self.SHELL_SIZES:
-            shell_info = self.SHELL_SIZES[self.shell_code]
+        shell_info = self.SHELL_SIZES.get(self.shell_code)
+        if shell_info is not None:
             props['shell_code'] = self.shell_code
-            props['shell_size'] = shell_info['size']
-            props['thread_size'] = shell_info['thread_size']
+            props['shell_size'] = shell_info.size
+            props['thread_size'] = shell_info.thread_size
         
         # Add insert arrangement
         props['insert_arrangement'] = self.insert_arrangement
         
         # Add insert arrangement details
-        if self.insert_arrangement in self.INSERT_ARRANGEMENTS:
-            insert_info = self.INSERT_ARRANGEMENTS[self.insert_arrangement]
+        insert_info = self.INSERT_ARRANGEMENTS.get(self.insert_arrangement)
+        if insert_info is not None:
             props['contact_count'] = insert_info['contacts']
             props['contact_size'] = insert_info['size']
             props['service_rating'] = insert_info['service_rating']
-            if 'positions' in insert_info:
-                props['contact_positions'] = insert_info['positions']
+            positions = insert_info.get('positions')
+            if positions is not None:
+                props['contact_positions'] = positions
         
         # Add contact type
-        if self.contact_type in self.CONTACT_TYPES:
-            contact_info = self.CONTACT_TYPES[self.contact_type]
-            props['contact_gender'] = contact_info['type']
-            if 'cycles' in contact_info:
-                props['mating_cycles'] = contact_info['cycles']
+        contact_info = self.CONTACT_TYPES.get(self.contact_type)
+        if contact_info is not None:
+            props['contact_gender'] = contact_info.type
+            cycles = contact_info.cycles
+            if cycles is not None:
+                props['mating_cycles'] = cycles
         
         # Add polarization
-        if self.polarization in self.POLARIZATIONS:
-            props['polarization'] = self.POLARIZATIONS[self.polarization]
+        polarization = self.POLARIZATIONS.get(self.polarization)
+        if polarization is not None:
+            props['polarization'] = polarization
         
         # Threading type
-        if self.series == 'III':
-            props['coupling_type'] = 'Triple-start thread'
-        elif self.series == 'IV':
-            props['coupling_type'] = '90° breech-lock'
+        props['coupling_type'] = self.COUPLING_TYPES[self.series]
         
         # EMC performance
         props['shielding'] = '65dB minimum at 10 GHz'
         props['sealing'] = 'IP67'
         
         # Add dimensions
-        if self.series == 'III' and self.shell_code in self.SERIES_III_DIMENSIONS:
-            props['dimensions'] = self.SERIES_III_DIMENSIONS[self.shell_code]
-        elif self.series == 'IV' and self.shell_code in self.SERIES_IV_DIMENSIONS:
-            props['dimensions'] = self.SERIES_IV_DIMENSIONS[self.shell_code]
+        dimensions = self.SERIES_DIMENSIONS[self.series].get(self.shell_code)
+        if dimensions is not None:
+            props['dimensions'] = dimensions
         
         # Add tooling requirements
-        if self.insert_arrangement in self.INSERT_ARRANGEMENTS:
-            contact_size = self.INSERT_ARRANGEMENTS[self.insert_arrangement]['size']
-            if contact_size in self.CRIMP_TOOLS:
-                props['tooling'] = self.CRIMP_TOOLS[contact_size]
+        if insert_info is not None:
+            tooling = self.CRIMP_TOOLS.get(insert_info['size'])
+            if tooling is not None:
+                props['tooling'] = tooling
         
         return props
     
+    @classmethod
+    def _normalize_tables(cls):
+        """Fill in optional finish fields so every class record has the same keys"""
+        defaults = {'temp_range': _NA, 'salt_spray': _NA, 'conductive': False, 'space_grade': False}
+        for class_info in cls.ALL_CLASSES.values():
+            for key, value in defaults.items():
+                class_info.setdefault(key, value)
+    
+    @classmethod
+    def _freeze_tables(cls):
+        """Make the lookup tables and their records read-only so cached properties cannot go stale"""
+        def freeze(value):
+            if isinstance(value, dict):
+                return MappingProxyType({key: freeze(item) for key, item in value.items()})
+            if isinstance(value, list):
+                return tuple(freeze(item) for item in value)
+            return value
+        
+        for name in ('SERIES_III', 'SERIES_IV', 'ENV_CLASSES', 'HERMETIC_CLASSES', 'ALL_CLASSES',
+                     'SHELL_SIZES', 'CONTACT_TYPES', 'CONTACT_SPECS', 'CONTACT_DIAMETERS',
+                     'POLARIZATIONS', 'INSERT_ARRANGEMENTS', 'SERIES_III_DIMENSIONS',
+                     'SERIES_IV_DIMENSIONS', 'SERIES_DIMENSIONS', 'CRIMP_TOOLS', 'COUPLING_TYPES'):
+            setattr(cls, name, freeze(getattr(cls, name)))
+    
     def get_contact_specs(self, contact_size):
         """Get specifications for a specific contact size"""
         if contact_size in self.CONTACT_SPECS:
-            return self.CONTACT_SPECS[contact_size]
+            return _thaw(self.CONTACT_SPECS[contact_size])
         return None
     
     def print_properties(self):
         """Print formatted properties"""
-        props = self.get_properties()
-        print(f"\n{'='*70}")
-        print(f"D38999 CONNECTOR SPECIFICATIONS")
-        print(f"{'='*70}")
-        print(f"Part Number: {props['part_number']}")
-        print(f"Specification: {props['specification']}")
-        print(f"Series: {props['series']}")
-        print(f"Description: {props['series_description']}")
-        print(f"\n{'-'*70}")
-        print(f"FINISH AND MATERIAL")
-        print(f"{'-'*70}")
-        print(f"Class: {props.get('class', 'N/A')}")
-        print(f"Finish: {props.get('finish', 'N/A')}")
-        print(f"Material: {props.get('material', 'N/A')}")
-        print(f"Temperature Range: {props.get('temperature_range', 'N/A')}")
-        print(f"Salt Spray: {props.get('salt_spray', 'N/A')}")
-        print(f"Conductive: {props.get('conductive', False)}")
-        print(f"Space Grade: {props.get('space_grade', False)}")
-        print(f"\n{'-'*70}")
-        print(f"MECHANICAL")
-        print(f"{'-'*70}")
-        print(f"Shell Code: {props.get('shell_code', 'N/A')}")
-        print(f"Shell Size: {props.get('shell_size', 'N/A')}")
-        print(f"Thread Size: {props.get('thread_size', 'N/A')}")
-        print(f"Coupling Type: {props.get('coupling_type', 'N/A')}")
-        
-        if 'dimensions' in props:
-            dims = props['dimensions']
-            print(f"\nDimensions (inches):")
+        props = self.properties
+        lines = [
+            _PROP_HEADER,
+            f"Part Number: {props['part_number']}",
+            f"Specification: {props['specification']}",
+            f"Series: {props['series']}",
+            f"Description: {props['series_description']}",
+            f"\n{SEP_DASH}",
+            "FINISH AND MATERIAL",
+            SEP_DASH,
+            f"Class: {props.get('class', 'N/A')}",
+            f"Finish: {props.get('finish', 'N/A')}",
+            f"Material: {props.get('material', 'N/A')}",
+            f"Temperature Range: {props.get('temperature_range', 'N/A')}",
+            f"Salt Spray: {props.get('salt_spray', 'N/A')}",
+            f"Conductive: {props.get('conductive', False)}",
+            f"Space Grade: {props.get('space_grade', False)}",
+            f"\n{SEP_DASH}",
+            "MECHANICAL",
+            SEP_DASH,
+            f"Shell Code: {props.get('shell_code', 'N/A')}",
+            f"Shell Size: {props.get('shell_size', 'N/A')}",
+            f"Thread Size: {props.get('thread_size', 'N/A')}",
+            f"Coupling Type: {props.get('coupling_type', 'N/A')}",
+        ]
+        
+        dims = props.get('dimensions')
+        if dims is not None:
+            lines.append("\nDimensions (inches):")
             for key, val in dims.items():
-                print(f"  {key.replace('_', ' ').title()}: {val}")
-        
-        print(f"\n{'-'*70}")
-        print(f"CONTACTS")
-        print(f"{'-'*70}")
-        print(f"Insert Arrangement: {props.get('insert_arrangement', 'N/A')}")
-        print(f"Contact Count: {props.get('contact_count', 'N/A')}")
-        print(f"Contact Size: #{props.get('contact_size', 'N/A')}")
-        print(f"Service Rating: {props.get('service_rating', 'N/A')}")
-        print(f"Contact Gender: {props.get('contact_gender', 'N/A')}")
-        print(f"Mating Cycles: {props.get('mating_cycles', 'N/A')}")
-        print(f"Polarization: {props.get('polarization', 'N/A')}")
+                lines.append(f"  {_title_label(key)}: {val}")
+        
+        lines += [
+            f"\n{SEP_DASH}",
+            "CONTACTS",
+            SEP_DASH,
+            f"Insert Arrangement: {props.get('insert_arrangement', 'N/A')}",
+            f"Contact Count: {props.get('contact_count', 'N/A')}",
+            f"Contact Size: #{props.get('contact_size', 'N/A')}",
+            f"Service Rating: {props.get('service_rating', 'N/A')}",
+            f"Contact Gender: {props.get('contact_gender', 'N/A')}",
+            f"Mating Cycles: {props.get('mating_cycles', 'N/A')}",
+            f"Polarization: {props.get('polarization', 'N/A')}",
+        ]
         
         # Print contact positions if available
-        if 'contact_positions' in props:
-            print(f"\nContact Positions:")
-            for pos in props['contact_positions']:
-                print(f"  {pos['label']}: Angle={pos['angle']}°, Radius={pos['radius']}mm")
-        
-        print(f"\n{'-'*70}")
-        print(f"TOOLING REQUIREMENTS")
-        print(f"{'-'*70}")
-        if 'tooling' in props:
-            for tool, part in props['tooling'].items():
-                print(f"{tool.replace('_', ' ').title()}: {part}")
+        positions = props.get('contact_positions')
+        if positions is not None:
+            lines.append("\nContact Positions:")
+            lines.extend(map(_POSITION_ROW, positions))
+        
+        lines += [f"\n{SEP_DASH}", "TOOLING REQUIREMENTS", SEP_DASH]
+        tooling = props.get('tooling')
+        if tooling is not None:
+            for tool, part in tooling.items():
+                lines.append(f"{_title_label(tool)}: {part}")
         else:
-            print("No tooling data available")
-        
-        print(f"\n{'-'*70}")
-        print(f"PERFORMANCE")
-        print(f"{'-'*70}")
-        print(f"Shielding: {props.get('shielding', 'N/A')}")
-        print(f"Sealing: {props.get('sealing', 'N/A')}")
-        print(f"{'='*70}\n")
+            lines.append("No tooling data available")
+        
+        lines += [
+            f"\n{SEP_DASH}",
+            "PERFORMANCE",
+            SEP_DASH,
+            f"Shielding: {props.get('shielding', 'N/A')}",
+            f"Sealing: {props.get('sealing', 'N/A')}",
+            f"{SEP_EQ}\n",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def generate_svg(self, filename=None):
         """Generate SVG representation of connector face"""
-        props = self.get_properties()
-        
-        if 'contact_positions' not in props:
+        svg = self._render_svg()
+        if svg is None:
             return "SVG generation requires contact position data"
         
+        if filename:
+            Path(filename).write_bytes(svg.encode('utf-8'))
+            print(f"SVG saved to {filename}")
+        
+        return svg
+    
+    def _render_svg(self):
+        """Build the connector face SVG, or None without contact position data"""
+        positions = self._POSITION_TABLE.get(self.insert_arrangement)
+        if positions is None:
+            return None
+        
+        props = self.properties
+        
         # SVG parameters
         width = 400
         height = 400
@@ -436,16 +615,8 @@ class D38999PartNumber:
         center_y = height / 2
         scale = 20  # pixels per mm
         
-        # Contact sizes in mm
-        contact_diameters = {
-            '22D': 1.3,
-            '20': 1.5,
-            '16': 2.0,
-            '12': 2.8
-        }
-        
         contact_size = props.get('contact_size', '20')
-        contact_dia = contact_diameters.get(contact_size, 1.5) * scale
+        contact_dia = self.CONTACT_DIAMETERS.get(contact_size, 1.5) * scale
         
         # Shell diameter from dimensions
         shell_radius = 50  # default
@@ -454,17 +625,9 @@ class D38999PartNumber:
             shell_radius = (shell_dia_inches * 25.4 / 2) * scale  # convert to mm then pixels
         
         # Build SVG
-        svg = f'''<?xml version="1.0" encoding="UTF-8"?>
+        header = f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">
-  <defs>
-    <style>
-      .shell {{ fill: #cccccc; stroke: #333333; stroke-width: 2; }}
-      .contact {{ fill: #ffd700; stroke: #333333; stroke-width: 1; }}
-      .label {{ font-family: Arial; font-size: 10px; fill: #000000; text-anchor: middle; }}
-      .title {{ font-family: Arial; font-size: 14px; font-weight: bold; fill: #000000; }}
-      .keyway {{ fill: #666666; }}
-    </style>
-  </defs>
+{_SVG_DEFS}
   
   <!-- Title -->
   <text x="{center_x}" y="20" class="title" text-anchor="middle">{props['part_number']}</text>
@@ -481,32 +644,83 @@ class D38999PartNumber:
   <!-- Contacts -->
 '''
         
-        for pos in props['contact_positions']:
-            angle_rad = (pos['angle'] - 90) * 3.14159 / 180  # -90 to start at top
-            radius_pixels = pos['radius'] * scale
-            x = center_x + radius_pixels * math.cos(angle_rad)
-            y = center_y + radius_pixels * math.sin(angle_rad)
+        svg_parts = [header]
+        contact_r = f"{contact_dia / 2:.1f}"
+        for label, radius, cos_a, sin_a in positions:
+            radius_pixels = radius * scale
+            x = center_x + radius_pixels * cos_a
+            y = center_y + radius_pixels * sin_a
             
-            svg += f'  <circle cx="{x:.1f}" cy="{y:.1f}" r="{contact_dia/2:.1f}" class="contact"/>\n'
+            svg_parts.append(f'  <circle cx="{x:.1f}" cy="{y:.1f}" r="{contact_r}" class="contact"/>\n')
             
-            # Label
-            label_offset = contact_dia / 2 + 8
-            label_x = x
-            label_y = y + 3  # slight offset for better centering
-            svg += f'  <text x="{label_x:.1f}" y="{label_y:.1f}" class="label">{pos["label"]}</text>\n'
-        
-        svg += '''
-  <!-- Legend -->
-  <text x="10" y="380" class="label" text-anchor="start">● Pin Contact</text>
-  <text x="10" y="395" class="label" text-anchor="start">▮ Master Keyway</text>
-</svg>'''
-        
-        if filename:
-            with open(filename, 'w') as f:
-                f.write(svg)
-            print(f"SVG saved to {filename}")
+            # Label, with a slight offset for better centering
+            svg_parts.append(f'  <text x="{x:.1f}" y="{y + 3:.1f}" class="label">{label}</text>\n')
         
-        return svg
+        svg_parts.append(_SVG_LEGEND)
+        return "".join(svg_parts)
+
+
+def _compute_all_positions():
+    """Contact positions per insert arrangement as (label, radius, cos, sin) tuples"""
+    table = {}
+    for arrangement, info in D38999PartNumber.INSERT_ARRANGEMENTS.items():
+        if 'positions' not in info:
+            continue
+        rows = []
+        for pos in info['positions']:
+            angle_rad = math.radians(pos['angle'] - 90)  # -90 to start at top
+            rows.append((pos['label'], pos['radius'], math.cos(angle_rad), math.sin(angle_rad)))
+        table[arrangement] = tuple(rows)
+    return table
+
+
+D38999PartNumber._normalize_tables()
+D38999PartNumber._freeze_tables()
+D38999PartNumber._POSITION_TABLE = _compute_all_positions()
+
+
+@functools.lru_cache(maxsize=4096)
+def _compute_properties(cls, series_code, class_code, shell_code, insert_arrangement,
+                        contact_type, polarization):
+    """Read-only properties shared by every part of cls with the same configuration"""
+    part = cls(series_code, class_code, shell_code, insert_arrangement, contact_type, polarization)
+    return MappingProxyType(part._build_properties())
+
+
+# Attribute sections that are identical for every part. They are shared by
+# reference across the attributes documents, so treat them as read-only.
+_ATTR_TEMPLATE = {
+    'standards_compliance': {
+        'mil_dtl_38999': True,
+        'mil_std_1560': True,
+        'rohs_compliant': None,
+        'reach_compliant': None,
+        'dfars_compliant': True
+    },
+    'procurement': {
+        'cage_code': '06324',  # Glenair CAGE code
+        'lead_time_weeks': None,
+        'minimum_order_quantity': None,
+        'unit_price': None,
+        'availability': None
+    },
+    'quality': {
+        'qpl_listed': True,
+        'test_reports_available': False,
+        'certificate_of_conformance': False,
+        'inspection_level': None
+    }
+}
+
+# Marks a filter_parts property whose values cannot be hash-indexed
+_UNINDEXABLE = object()
+
+# Column headings of the CSV catalog written by export_catalog
+_CATALOG_HEADER = (
+    'Part Number', 'Series', 'Description', 'Class', 'Finish', 'Shell Size',
+    'Insert Arrangement', 'Contact Count', 'Contact Size', 'Contact Type',
+    'Polarization', 'Thread Size', 'Temperature Range'
+)
 
 
 class D38999PartNumberGenerator:
@@ -515,6 +729,8 @@ class D38999PartNumberGenerator:
     def __init__(self, base_dir='.', revision=REVISION, release_status=RELEASE_STATUS):
         self.base_dir = Path(base_dir)
         self.generated_parts = []
+        self._filter_index = {}
+        self._filter_index_source = (None, 0)
         self.revision = revision
         self.release_status = release_status
     
@@ -534,12 +750,30 @@ class D38999PartNumberGenerator:
         Returns:
             List of D38999PartNumber objects
         """
-        self.generated_parts = []
-        invalid_parts = []
+        ranges = [list(codes) for codes in (series_codes, class_codes, shell_codes,
+                                            insert_arrangements, contact_types, polarizations)]
+        self.generated_parts = list(self.iter_part_numbers(*ranges))
+        skipped = math.prod(len(codes) for codes in ranges) - len(self.generated_parts)
+        
+        print(f"\nGenerated {len(self.generated_parts)} valid part numbers")
+        if skipped:
+            print(f"Skipped {skipped} invalid combinations")
         
-        # Generate all combinations
+        return self.generated_parts
+    
+    def iter_part_numbers(self, series_codes, class_codes, shell_codes,
+                          insert_arrangements, contact_types, polarizations):
+        """
+        Lazily yield part numbers for all valid combinations of the given ranges.
+        
+        Takes the same arguments as generate_part_numbers() but keeps nothing in
+        memory, so large ranges can be streamed straight into create_directories().
+        
+        Yields:
+            D38999PartNumber objects; invalid combinations are skipped
+        """
         combinations = itertools.product(
-            series_codes,
+            self._valid_series_codes(series_codes),
             class_codes,
             shell_codes,
             insert_arrangements,
@@ -547,41 +781,55 @@ class D38999PartNumberGenerator:
             polarizations
         )
         
-        for series, cls, shell, insert, contact, polar in combinations:
-            try:
-                part = D38999PartNumber(series, cls, shell, insert, contact, polar)
-                self.generated_parts.append(part)
-            except ValueError as e:
-                invalid_parts.append({
-                    'series': series,
-                    'class': cls,
-                    'shell': shell,
-                    'insert': insert,
-                    'contact': contact,
-                    'polarization': polar,
-                    'error': str(e)
-                })
+        for combination in combinations:
+            yield D38999PartNumber(*combination)
+    
+    def build_part_numbers_only(self, series_codes, class_codes, shell_codes,
+                                insert_arrangements, contact_types, polarizations):
+        """
+        Build part number strings for all valid combinations of the given ranges.
         
-        print(f"\nGenerated {len(self.generated_parts)} valid part numbers")
-        if invalid_parts:
-            print(f"Skipped {len(invalid_parts)} invalid combinations")
+        Takes the same arguments as generate_part_numbers() but creates no
+        D38999PartNumber objects, for callers that only need the names.
         
-        return self.generated_parts
+        Returns:
+            List of part number strings (e.g., 'D38999/24FAA35PN')
+        """
+        ranges = [self._valid_series_codes(series_codes)]
+        for codes in (class_codes, shell_codes, insert_arrangements, contact_types, polarizations):
+            ranges.append([code.upper() for code in codes])
+        
+        return ["D38999/" + "".join(combination) for combination in itertools.product(*ranges)]
+    
+    @staticmethod
+    def _valid_series_codes(series_codes):
+        """
+        Series codes known to D38999PartNumber, in input order.
+        
+        The series code is the only field D38999PartNumber rejects, so invalid
+        ones are dropped up front instead of catching ValueError per combination.
+        """
+        return [code for code in series_codes
+                if code in D38999PartNumber.SERIES_III or code in D38999PartNumber.SERIES_IV]
     
-    def create_directories(self, root_dir=None, include_subdirs=False):
+    def create_directories(self, root_dir=None, include_subdirs=False, parts=None):
         """
         Create directory structure for all generated part numbers.
         
         Args:
             root_dir: Root directory name. If None, creates directories at current level
             include_subdirs: If True, create subdirectories for docs, drawings, etc.
+            parts: Iterable of D38999PartNumber objects, e.g. from iter_part_numbers().
+                   If None, uses the parts from generate_part_numbers()
         
         Returns:
             Dictionary with statistics about created directories
         """
-        if not self.generated_parts:
-            print("No part numbers generated. Run generate_part_numbers() first.")
-            return None
+        if parts is None:
+            if not self.generated_parts:
+                print("No part numbers generated. Run generate_part_numbers() first.")
+                return None
+            parts = self.generated_parts
         
         # If root_dir is None, use current directory
         if root_dir is None:
@@ -594,68 +842,124 @@ class D38999PartNumberGenerator:
             'created': 0,
             'already_existed': 0,
             'failed': 0,
-            'total': len(self.generated_parts)
+            'total': 0
         }
         
         subdirs = []
         if include_subdirs:
             subdirs = ['drawings', 'specifications', 'test_reports', 'tooling', 'assembly']
         
-        for part in self.generated_parts:
-            part_number = part.build_part_number()
+        # List the base directory once rather than stat() every part directory
+        try:
+            with os.scandir(base_path) as entries:
+                existing = {entry.name for entry in entries}
+        except FileNotFoundError:
+            existing = set()
+        
+        # Filesystem work is I/O bound, so parts are created on a thread pool.
+        # At most max_pending parts are in flight, so a streamed parts iterable
+        # is never queued up in memory; only the main thread touches stats
+        max_pending = 4 * MAX_WORKERS
+        pending = {}
+        
+        def collect(done):
+            for future in done:
+                part = pending.pop(future)
+                status, error = future.result()
+                if status is not None:
+                    stats[status] += 1
+                if error is not None:
+                    stats['failed'] += 1
+                    _LOG.warning("Failed to create directory for %s: %s",
+                                 part.build_part_number(), error)
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for part in parts:
+                stats['total'] += 1
+                if len(pending) >= max_pending:
+                    collect(wait(pending, return_when=FIRST_COMPLETED).done)
+                future = executor.submit(self._create_part_directory, part, base_path,
+                                         existing, subdirs)
+                pending[future] = part
+            collect(wait(pending).done)
+        
+        lines = ["\nDirectory Creation Summary:"]
+        if root_dir:
+            lines.append(f"  Root directory: {base_path.absolute()}")
+        else:
+            lines.append(f"  Location: Current directory ({base_path.absolute()})")
+        lines += [
+            f"  Revision: {self.revision}",
+            f"  Release Status: {self.release_status if self.release_status else 'Not Set'}",
+            f"  Total part numbers: {stats['total']}",
+            f"  Directories created: {stats['created']}",
+            f"  Already existed: {stats['already_existed']}",
+            f"  Failed: {stats['failed']}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        
+        return stats
+    
+    def _create_part_directory(self, part, base_path, existing, subdirs):
+        """
+        Create the directories and files for a single part.
+        
+        Args:
+            existing: Names found in base_path before the run started
+        
+        Returns:
+            Tuple (status, error): the stats key to count ('created',
+            'already_existed' or None), and the exception raised, if any
+        """
+        status = None
+        try:
             # Clean part number for directory name (replace / with -)
-            dir_name = part_number.replace('/', '-')
+            dir_name = part.build_part_number().replace('/', '-')
             part_dir = base_path / dir_name
             
             # Create revision directory inside part directory
-            rev_dir_name = f"{dir_name}-{self.revision}"
-            rev_dir = part_dir / rev_dir_name
+            rev_dir = part_dir / f"{dir_name}-{self.revision}"
+            
+            if dir_name in existing and rev_dir.exists():
+                return 'already_existed', None
             
+            # Create main part directory
+            part_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Create revision directory; it already exists if a duplicate
+            # part number earlier in this run created it
             try:
-                if part_dir.exists() and rev_dir.exists():
-                    stats['already_existed'] += 1
-                else:
-                    # Create main part directory
-                    part_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    # Create revision directory
-                    rev_dir.mkdir(parents=True, exist_ok=True)
-                    stats['created'] += 1
-                    
-                    # Create subdirectories if requested (in revision directory)
-                    for subdir in subdirs:
-                        (rev_dir / subdir).mkdir(exist_ok=True)
-                    
-                    # Create attributes JSON file
-                    self._create_attributes_json(part, rev_dir, dir_name)
-                    
-                    # Create placeholder SVG file
-                    self._create_placeholder_svg(rev_dir, dir_name)
-                    
-                    # Create a README in the main part directory
-                    self._create_readme(part, part_dir)
-                    
-            except Exception as e:
-                stats['failed'] += 1
-                print(f"Failed to create directory for {part_number}: {e}")
-        
-        print(f"\nDirectory Creation Summary:")
-        if root_dir:
-            print(f"  Root directory: {base_path.absolute()}")
-        else:
-            print(f"  Location: Current directory ({base_path.absolute()})")
-        print(f"  Revision: {self.revision}")
-        print(f"  Release Status: {self.release_status if self.release_status else 'Not Set'}")
-        print(f"  Total part numbers: {stats['total']}")
-        print(f"  Directories created: {stats['created']}")
-        print(f"  Already existed: {stats['already_existed']}")
-        print(f"  Failed: {stats['failed']}")
+                rev_dir.mkdir()
+            except FileExistsError:
+                return 'already_existed', None
+            status = 'created'
+            
+            # Create subdirectories if requested (in revision directory)
+            for subdir in subdirs:
+                (rev_dir / subdir).mkdir(exist_ok=True)
+            
+            # Create attributes JSON file
+            self._create_attributes_json(part, rev_dir, dir_name)
+            
+            # Create placeholder SVG file
+            self._create_placeholder_svg(rev_dir, dir_name)
+            
+            # Create a README in the main part directory
+            self._create_readme(part, part_dir)
+        except Exception as e:
+            return status, e
         
-        return stats
+        return status, None
     
     def _create_attributes_json(self, part, directory, dir_name):
         """Create JSON file with comprehensive part attributes"""
-        props = part.get_properties()
+        props = part.properties
+        get = props.get
+        
+        # Split the temperature range once for the environmental section
+        temp_min, sep, temp_max = get('temperature_range', '').partition(' to ')
+        if not sep:
+            temp_min = temp_max = None
         
         # Build comprehensive attributes dictionary
         attributes = {
@@ -677,72 +981,55 @@ class D38999PartNumberGenerator:
                 'mil_spec': 'MIL-DTL-38999'
             },
             'finish_and_material': {
-                'class_code': props.get('class', 'N/A'),
-                'finish_name': props.get('finish', 'N/A'),
-                'material': props.get('material', 'N/A'),
-                'temperature_range': props.get('temperature_range', 'N/A'),
-                'salt_spray_rating': props.get('salt_spray', 'N/A'),
-                'conductive': props.get('conductive', False),
-                'space_grade': props.get('space_grade', False)
+                'class_code': get('class', _NA),
+                'finish_name': get('finish', _NA),
+                'material': get('material', _NA),
+                'temperature_range': get('temperature_range', _NA),
+                'salt_spray_rating': get('salt_spray', _NA),
+                'conductive': get('conductive', False),
+                'space_grade': get('space_grade', False)
             },
             'mechanical': {
-                'shell_code': props.get('shell_code', 'N/A'),
-                'shell_size': props.get('shell_size', 'N/A'),
-                'thread_size': props.get('thread_size', 'N/A'),
-                'coupling_type': props.get('coupling_type', 'N/A'),
-                'dimensions': props.get('dimensions', {})
+                'shell_code': get('shell_code', _NA),
+                'shell_size': get('shell_size', _NA),
+                'thread_size': get('thread_size', _NA),
+                'coupling_type': get('coupling_type', _NA),
+                'dimensions': get('dimensions', {})
             },
             'contacts': {
-                'insert_arrangement': props.get('insert_arrangement', 'N/A'),
-                'contact_count': props.get('contact_count', 'N/A'),
-                'contact_size': props.get('contact_size', 'N/A'),
-                'service_rating': props.get('service_rating', 'N/A'),
-                'contact_gender': props.get('contact_gender', 'N/A'),
+                'insert_arrangement': get('insert_arrangement', _NA),
+                'contact_count': get('contact_count', _NA),
+                'contact_size': get('contact_size', _NA),
+                'service_rating': get('service_rating', _NA),
+                'contact_gender': get('contact_gender', _NA),
                 'contact_type_code': part.contact_type,
-                'mating_cycles': props.get('mating_cycles', 'N/A'),
-                'contact_positions': props.get('contact_positions', [])
+                'mating_cycles': get('mating_cycles', _NA),
+                'contact_positions': get('contact_positions', [])
             },
             'polarization': {
                 'polarization_code': part.polarization,
-                'polarization_description': props.get('polarization', 'N/A')
+                'polarization_description': get('polarization', _NA)
             },
             'electrical': {
-                'shielding': props.get('shielding', 'N/A'),
+                'shielding': get('shielding', _NA),
                 'voltage_rating': None,  # Can be derived from service rating
                 'current_rating': None,  # Depends on contact size
                 'dielectric_withstanding_voltage': None,
                 'insulation_resistance': None
             },
             'environmental': {
-                'sealing_class': props.get('sealing', 'N/A'),
+                'sealing_class': get('sealing', _NA),
                 'ip_rating': 'IP67',
-                'operating_temperature_min': props.get('temperature_range', '').split(' to ')[0] if ' to ' in props.get('temperature_range', '') else None,
-                'operating_temperature_max': props.get('temperature_range', '').split(' to ')[1] if ' to ' in props.get('temperature_range', '') else None,
+                'operating_temperature_min': temp_min,
+                'operating_temperature_max': temp_max,
                 'altitude_rating': '70,000 ft',
                 'vibration_rating': 'Per MIL-DTL-38999',
                 'shock_rating': 'Per MIL-DTL-38999'
             },
-            'tooling': props.get('tooling', {}),
-            'standards_compliance': {
-                'mil_dtl_38999': True,
-                'mil_std_1560': True,
-                'rohs_compliant': None,
-                'reach_compliant': None,
-                'dfars_compliant': True
-            },
-            'procurement': {
-                'cage_code': '06324',  # Glenair CAGE code
-                'lead_time_weeks': None,
-                'minimum_order_quantity': None,
-                'unit_price': None,
-                'availability': None
-            },
-            'quality': {
-                'qpl_listed': True,
-                'test_reports_available': False,
-                'certificate_of_conformance': False,
-                'inspection_level': None
-            },
+            'tooling': get('tooling', {}),
+            'standards_compliance': _ATTR_TEMPLATE['standards_compliance'],
+            'procurement': _ATTR_TEMPLATE['procurement'],
+            'quality': _ATTR_TEMPLATE['quality'],
             'notes': {
                 'general': f"D38999 Series {props['series']} connector per MIL-DTL-38999",
                 'assembly': "Requires appropriate crimp contacts and tooling",
@@ -753,70 +1040,61 @@ class D38999PartNumberGenerator:
         
         # Write JSON file
         json_file = directory / f"{dir_name}-{self.revision}-attributes.json"
-        with open(json_file, 'w') as f:
-            json.dump(attributes, f, indent=2)
+        # Released parts get readable JSON; other runs stay compact (pretty-print with `jq .`)
+        json_file.write_bytes(_dump_json(attributes, indent=self.release_status == 'Released'))
     
     def _create_placeholder_svg(self, directory, dir_name):
         """Create placeholder SVG file for future drawing"""
         svg_file = directory / f"{dir_name}-{self.revision}-drawing.svg"
         
-        placeholder_svg = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="400" height="400" xmlns="http://www.w3.org/2000/svg">
-  <defs>
-    <style>
-      .placeholder {{ fill: #f0f0f0; stroke: #999999; stroke-width: 2; stroke-dasharray: 5,5; }}
-      .text {{ font-family: Arial; font-size: 14px; fill: #666666; text-anchor: middle; }}
-    </style>
-  </defs>
-  
-  <rect x="10" y="10" width="380" height="380" class="placeholder"/>
-  <text x="200" y="190" class="text">{dir_name}</text>
-  <text x="200" y="210" class="text">Revision {self.revision}</text>
-  <text x="200" y="230" class="text">Drawing Placeholder</text>
-</svg>'''
-        
-        with open(svg_file, 'w') as f:
-            f.write(placeholder_svg)
+        svg_file.write_bytes(b''.join((
+            _PLACEHOLDER_SVG_HEAD, dir_name.encode('utf-8'),
+            _PLACEHOLDER_SVG_MID, str(self.revision).encode('utf-8'),
+            _PLACEHOLDER_SVG_TAIL,
+        )))
     
     def _create_readme(self, part, directory):
         """Create a README file with part specifications"""
         readme_path = directory / 'README.txt'
-        props = part.get_properties()
-        
-        with open(readme_path, 'w') as f:
-            f.write("=" * 70 + "\n")
-            f.write(f"D38999 CONNECTOR SPECIFICATIONS\n")
-            f.write("=" * 70 + "\n")
-            f.write(f"Part Number: {props['part_number']}\n")
-            f.write(f"Specification: {props['specification']}\n")
-            f.write(f"Series: {props['series']}\n")
-            f.write(f"Description: {props['series_description']}\n\n")
-            
-            f.write("-" * 70 + "\n")
-            f.write("FINISH AND MATERIAL\n")
-            f.write("-" * 70 + "\n")
-            f.write(f"Class: {props.get('class', 'N/A')}\n")
-            f.write(f"Finish: {props.get('finish', 'N/A')}\n")
-            f.write(f"Material: {props.get('material', 'N/A')}\n")
-            f.write(f"Temperature Range: {props.get('temperature_range', 'N/A')}\n\n")
-            
-            f.write("-" * 70 + "\n")
-            f.write("MECHANICAL\n")
-            f.write("-" * 70 + "\n")
-            f.write(f"Shell Size: {props.get('shell_size', 'N/A')}\n")
-            f.write(f"Thread Size: {props.get('thread_size', 'N/A')}\n")
-            f.write(f"Coupling Type: {props.get('coupling_type', 'N/A')}\n\n")
-            
-            f.write("-" * 70 + "\n")
-            f.write("CONTACTS\n")
-            f.write("-" * 70 + "\n")
-            f.write(f"Insert Arrangement: {props.get('insert_arrangement', 'N/A')}\n")
-            f.write(f"Contact Count: {props.get('contact_count', 'N/A')}\n")
-            f.write(f"Contact Size: #{props.get('contact_size', 'N/A')}\n")
-            f.write(f"Contact Gender: {props.get('contact_gender', 'N/A')}\n")
-            f.write(f"Mating Cycles: {props.get('mating_cycles', 'N/A')}\n\n")
-            
-            f.write("=" * 70 + "\n")
+        props = part.properties
+        
+        lines = [
+            SEP_EQ,
+            "D38999 CONNECTOR SPECIFICATIONS",
+            SEP_EQ,
+            f"Part Number: {props['part_number']}",
+            f"Specification: {props['specification']}",
+            f"Series: {props['series']}",
+            f"Description: {props['series_description']}",
+            "",
+            SEP_DASH,
+            "FINISH AND MATERIAL",
+            SEP_DASH,
+            f"Class: {props.get('class', 'N/A')}",
+            f"Finish: {props.get('finish', 'N/A')}",
+            f"Material: {props.get('material', 'N/A')}",
+            f"Temperature Range: {props.get('temperature_range', 'N/A')}",
+            "",
+            SEP_DASH,
+            "MECHANICAL",
+            SEP_DASH,
+            f"Shell Size: {props.get('shell_size', 'N/A')}",
+            f"Thread Size: {props.get('thread_size', 'N/A')}",
+            f"Coupling Type: {props.get('coupling_type', 'N/A')}",
+            "",
+            SEP_DASH,
+            "CONTACTS",
+            SEP_DASH,
+            f"Insert Arrangement: {props.get('insert_arrangement', 'N/A')}",
+            f"Contact Count: {props.get('contact_count', 'N/A')}",
+            f"Contact Size: #{props.get('contact_size', 'N/A')}",
+            f"Contact Gender: {props.get('contact_gender', 'N/A')}",
+            f"Mating Cycles: {props.get('mating_cycles', 'N/A')}",
+            "",
+            SEP_EQ,
+        ]
+        
+        readme_path.write_bytes(("\n".join(lines) + "\n").encode('utf-8'))
     
     def generate_svgs(self, output_dir=None, populate_drawings=False):
         """
@@ -835,43 +1113,62 @@ class D38999PartNumberGenerator:
         generated = 0
         skipped = 0
         
-        for part in self.generated_parts:
-            part_number = part.build_part_number()
-            dir_name = part_number.replace('/', '-')
-            rev_dir_name = f"{dir_name}-{self.revision}"
-            
-            # Check if this part has position data
-            props = part.get_properties()
-            if 'contact_positions' in props and populate_drawings:
-                try:
+        # Drawings are rendered and written on a thread pool; results are
+        # reported from the main thread in part order
+        results = []
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for part in self.generated_parts:
+                part_number = part.build_part_number()
+                dir_name = part_number.replace('/', '-')
+                rev_dir_name = f"{dir_name}-{self.revision}"
+                
+                # Check if this part has position data
+                props = part.properties
+                if 'contact_positions' in props and populate_drawings:
                     # Generate actual SVG with contact positions
                     svg_file = output_path / dir_name / rev_dir_name / f"{dir_name}-{self.revision}-drawing.svg"
-                    part.generate_svg(str(svg_file))
-                    generated += 1
-                except Exception as e:
-                    print(f"Failed to generate SVG for {part_number}: {e}")
+                    results.append((part_number, svg_file,
+                                    executor.submit(self._write_drawing, part, svg_file)))
+                elif populate_drawings:
                     skipped += 1
+        
+        lines = []
+        for part_number, svg_file, future in results:
+            error = future.result()
+            if error is None:
+                lines.append(f"SVG saved to {svg_file}")
+                generated += 1
             else:
-                if not populate_drawings:
-                    # Placeholder already created
-                    pass
-                else:
-                    skipped += 1
+                _LOG.warning("Failed to generate SVG for %s: %s", part_number, error)
+                skipped += 1
         
         if populate_drawings:
-            print(f"\nSVG Generation Summary:")
-            print(f"  SVGs generated: {generated}")
-            print(f"  Skipped (no position data): {skipped}")
+            lines += [
+                "\nSVG Generation Summary:",
+                f"  SVGs generated: {generated}",
+                f"  Skipped (no position data): {skipped}",
+            ]
         else:
-            print(f"\nPlaceholder SVGs created for all parts")
-            print(f"  Use populate_drawings=True to generate actual drawings")
+            lines += [
+                "\nPlaceholder SVGs created for all parts",
+                "  Use populate_drawings=True to generate actual drawings",
+            ]
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    def _write_drawing(self, part, svg_file):
+        """Render a part's connector face into svg_file; returns the exception raised, if any"""
+        try:
+            svg_file.write_bytes(part._render_svg().encode('utf-8'))
+        except Exception as e:
+            return e
+        return None
     
     def export_catalog(self, filename='part_catalog.csv'):
         """
         Export all generated part numbers to a CSV catalog.
         
         Args:
-            filename: Output CSV filename
+            filename: Output CSV filename; a '.gz' suffix writes gzip-compressed CSV
         """
         if not self.generated_parts:
             print("No part numbers to export.")
@@ -879,28 +1176,27 @@ class D38999PartNumberGenerator:
         
         output_path = self.base_dir / filename
         
-        with open(output_path, 'w') as f:
-            # Header
-            f.write("Part Number,Series,Description,Class,Finish,Shell Size,")
-            f.write("Insert Arrangement,Contact Count,Contact Size,Contact Type,")
-            f.write("Polarization,Thread Size,Temperature Range\n")
-            
-            # Data rows
-            for part in self.generated_parts:
-                props = part.get_properties()
-                f.write(f"{props['part_number']},")
-                f.write(f"{props['series']},")
-                f.write(f"\"{props['series_description']}\",")
-                f.write(f"{props.get('class', '')},")
-                f.write(f"\"{props.get('finish', '')}\",")
-                f.write(f"{props.get('shell_size', '')},")
-                f.write(f"{props.get('insert_arrangement', '')},")
-                f.write(f"{props.get('contact_count', '')},")
-                f.write(f"{props.get('contact_size', '')},")
-                f.write(f"\"{props.get('contact_gender', '')}\",")
-                f.write(f"{props.get('polarization', '')},")
-                f.write(f"{props.get('thread_size', '')},")
-                f.write(f"\"{props.get('temperature_range', '')}\"\n")
+        rows = (
+            (props['part_number'], props['series'], props['series_description'],
+             props.get('class', ''), props.get('finish', ''), props.get('shell_size', ''),
+             props.get('insert_arrangement', ''), props.get('contact_count', ''),
+             props.get('contact_size', ''), props.get('contact_gender', ''),
+             props.get('polarization', ''), props.get('thread_size', ''),
+             props.get('temperature_range', ''))
+            for props in (part.properties for part in self.generated_parts)
+        )
+        
+        # A .gz filename streams the catalog through a fast gzip level
+        if output_path.suffix == '.gz':
+            raw = io.BufferedWriter(gzip.GzipFile(output_path, 'wb', compresslevel=1), buffer_size=1 << 20)
+            f = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+        else:
+            f = open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+        
+        with f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(_CATALOG_HEADER)
+            writer.writerows(rows)
         
         print(f"\nCatalog exported to: {output_path.absolute()}")
         print(f"Total parts: {len(self.generated_parts)}")
@@ -915,54 +1211,68 @@ class D38999PartNumberGenerator:
         Returns:
             List of matching D38999PartNumber objects
         """
-        matching = []
+        # The cached index belongs to one generated_parts list at one length;
+        # reassigning or resizing the list rebuilds it
+        parts = self.generated_parts
+        source, length = self._filter_index_source
+        if source is not parts or length != len(parts):
+            self._filter_index = {}
+            self._filter_index_source = (parts, len(parts))
+        
+        matching = None
+        
+        for key, value in criteria.items():
+            indices = self._indices_matching(key, value)
+            matching = indices if matching is None else matching & indices
+            if not matching:
+                return []
+        
+        if matching is None:
+            return list(self.generated_parts)
+        return [self.generated_parts[i] for i in sorted(matching)]
+    
+    def _indices_matching(self, key, value):
+        """
+        Indices of generated parts whose property `key` equals `value`.
         
-        for part in self.generated_parts:
-            props = part.get_properties()
-            match = True
-            
-            for key, value in criteria.items():
-                if props.get(key) != value:
-                    match = False
-                    break
-            
-            if match:
-                matching.append(part)
+        Each property is indexed by value on first use, so repeated filter_parts()
+        calls are hash lookups rather than full scans. Replacing a part in place
+        without changing the list length is not detected. Properties holding
+        unhashable values (dimensions, tooling, positions) are scanned instead.
+        """
+        index = self._filter_index.get(key)
+        if index is None:
+            index = {}
+            try:
+                for i, part in enumerate(self.generated_parts):
+                    index.setdefault(part.properties.get(key), set()).add(i)
+            except TypeError:
+                index = _UNINDEXABLE
+            self._filter_index[key] = index
+        
+        if index is not _UNINDEXABLE:
+            try:
+                return index.get(value, set())
+            except TypeError:
+                pass
         
-        return matching
+        return {i for i, part in enumerate(self.generated_parts)
+                if _thaw(part.properties.get(key)) == value}
     
     def get_summary(self):
         """Get summary statistics of generated part numbers"""
         if not self.generated_parts:
             return "No part numbers generated."
         
+        all_props = [part.properties for part in self.generated_parts]
         summary = {
             'total_parts': len(self.generated_parts),
-            'series': {},
-            'classes': {},
-            'shell_sizes': {},
-            'contact_types': {}
+            'series': dict(Counter(props['series'] for props in all_props)),
+            'classes': dict(Counter(props.get('class', 'Unknown') for props in all_props)),
+            'shell_sizes': dict(Counter(props.get('shell_size', 'Unknown') for props in all_props)),
+            'contact_types': dict(Counter(props.get('contact_gender', 'Unknown') for props in all_props))
         }
         
-        for part in self.generated_parts:
-            props = part.get_properties()
-            
-            # Count by series
-            series = props['series']
-            summary['series'][series] = summary['series'].get(series, 0) + 1
-            
-            # Count by class
-            cls = props.get('class', 'Unknown')
-            summary['classes'][cls] = summary['classes'].get(cls, 0) + 1
-            
-            # Count by shell size
-            shell = props.get('shell_size', 'Unknown')
-            summary['shell_sizes'][shell] = summary['shell_sizes'].get(shell, 0) + 1
-            
-            # Count by contact type
-            contact = props.get('contact_gender', 'Unknown')
-            summary['contact_types'][contact] = summary['contact_types'].get(contact, 0) + 1
-        
         return summary
     
     def print_summary(self):
@@ -973,28 +1283,31 @@ class D38999PartNumberGenerator:
             print(summary)
             return
         
-        print(f"\n{'='*70}")
-        print("PART NUMBER GENERATION SUMMARY")
-        print(f"{'='*70}")
-        print(f"Total Part Numbers: {summary['total_parts']}")
+        lines = [
+            f"\n{SEP_EQ}",
+            "PART NUMBER GENERATION SUMMARY",
+            SEP_EQ,
+            f"Total Part Numbers: {summary['total_parts']}",
+        ]
         
-        print(f"\nBy Series:")
+        lines.append("\nBy Series:")
         for series, count in sorted(summary['series'].items()):
-            print(f"  Series {series}: {count}")
+            lines.append(f"  Series {series}: {count}")
         
-        print(f"\nBy Class:")
+        lines.append("\nBy Class:")
         for cls, count in sorted(summary['classes'].items()):
-            print(f"  Class {cls}: {count}")
+            lines.append(f"  Class {cls}: {count}")
         
-        print(f"\nBy Shell Size:")
+        lines.append("\nBy Shell Size:")
         for size, count in sorted(summary['shell_sizes'].items()):
-            print(f"  Size {size}: {count}")
+            lines.append(f"  Size {size}: {count}")
         
-        print(f"\nBy Contact Type:")
+        lines.append("\nBy Contact Type:")
         for contact, count in sorted(summary['contact_types'].items()):
-            print(f"  {contact}: {count}")
+            lines.append(f"  {contact}: {count}")
         
-        print(f"{'='*70}\n")
+        lines.append(f"{SEP_EQ}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Example usage
@@ -1070,7 +1383,7 @@ if __name__ == "__main__":
     filtered = generator.filter_parts(shell_size=11, contact_count=13)
     print(f"Found {len(filtered)} matching parts:")
     for part in filtered[:5]:  # Show first 5
-        props = part.get_properties()
+        props = part.properties
         print(f"  {props['part_number']} - {props['series_description']}")
     if len(filtered) > 5:
         print(f"  ... and {len(filtered) - 5} more")
@@ -0,0 +1,48 @@
+"""Tests for the D38999 part number builder"""
+import json
+import unittest
+
+from d38999 import D38999PartNumber
+
+
+class PublicGetterTests(unittest.TestCase):
+    def setUp(self):
+        self.part = D38999PartNumber('24', 'F', 'B', 'B35', 'P', 'N')
+
+    def assertPlain(self, value):
+        """Fail unless value is built only from plain dicts, lists and scalars"""
+        if isinstance(value, dict):
+            self.assertIs(type(value), dict)
+            for item in value.values():
+                self.assertPlain(item)
+        elif isinstance(value, (list, tuple)):
+            self.assertIs(type(value), list)
+            for item in value:
+                self.assertPlain(item)
+
+    def test_get_properties_is_plain_and_serializable(self):
+        props = self.part.get_properties()
+        self.assertPlain(props)
+        json.dumps(props)
+
+    def test_get_properties_copy_does_not_touch_cache(self):
+        props = self.part.get_properties()
+        props['dimensions']['shell_dia'] = 0
+        props['contact_positions'].clear()
+        self.assertNotEqual(self.part.properties['dimensions']['shell_dia'], 0)
+        self.assertTrue(self.part.properties['contact_positions'])
+
+    def test_get_contact_specs_is_plain_and_serializable(self):
+        for size in D38999PartNumber.CONTACT_SPECS:
+            specs = self.part.get_contact_specs(size)
+            self.assertPlain(specs)
+            json.dumps(specs)
+            specs['env_current'] = 0
+            self.assertNotEqual(self.part.get_contact_specs(size)['env_current'], 0)
+
+    def test_get_contact_specs_unknown_size(self):
+        self.assertIsNone(self.part.get_contact_specs('99'))
+
+
+if __name__ == '__main__':
+    unittest.main()